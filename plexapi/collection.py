@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 from pathlib import Path
-from urllib.parse import quote_plus
+from urllib.parse import quote, quote_plus
 
 from plexapi import media, utils
 from plexapi.base import PlexPartialObject
@@ -13,6 +13,46 @@ from plexapi.mixins import (
 )
 from plexapi.utils import deprecated
 
+_VIDEO_SUBTYPES = frozenset({'movie', 'show', 'season', 'episode'})
+_AUDIO_SUBTYPES = frozenset({'artist', 'album', 'track'})
+_PHOTO_SUBTYPES = frozenset({'photoalbum', 'photo'})
+
+_MODE_DICT = {
+    'default': -1,
+    'hide': 0,
+    'hideItems': 1,
+    'showItems': 2
+}
+
+_SORT_DICT = {
+    'release': 0,
+    'alpha': 1,
+    'custom': 2
+}
+
+
+def _int(value, default=None):
+    """ Cast an XML attribute value to an int, mirroring :func:`~plexapi.utils.cast` semantics. """
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return float('nan')
+
+
+def _bool(value):
+    """ Cast an XML attribute value to a bool. Anything other than 1/True/'1'/'true' maps to False. """
+    return value in (1, True, '1', 'true')
+
+
+def _ratingKeys(items, itemType):
+    """ Yield the string ratingKey for each item, validating the media types are not mixed. """
+    for item in items:
+        if item.type != itemType:  # pragma: no cover
+            raise BadRequest(f'Can not mix media types when building a collection: {itemType} and {item.type}')
+        yield str(item.ratingKey)
+
 
 @utils.registerPlexObject
 class Collection(
@@ -46,7 +86,9 @@ class Collection(
             librarySectionID (int): :class:`~plexapi.library.LibrarySection` ID.
             librarySectionKey (str): :class:`~plexapi.library.LibrarySection` key.
             librarySectionTitle (str): :class:`~plexapi.library.LibrarySection` title.
+            listType (str): The listType for the collection (video, audio, or photo).
             maxYear (int): Maximum year for the items in the collection.
+            metadataType (str): The type of metadata in the collection (same as subtype).
             minYear (int): Minimum year for the items in the collection.
             rating (float): Collection rating (7.9; 9.8; 8.1).
             ratingCount (int): The number of ratings.
@@ -67,44 +109,61 @@ class Collection(
     TYPE = 'collection'
 
     def _loadData(self, data):
+        get = data.attrib.get  # bind locals to avoid repeated lookups in this hot path
+        cast = utils.cast
+        toDatetime = utils.toDatetime
         self._data = data
-        self.addedAt = utils.toDatetime(data.attrib.get('addedAt'))
-        self.art = data.attrib.get('art')
-        self.artBlurHash = data.attrib.get('artBlurHash')
-        self.audienceRating = utils.cast(float, data.attrib.get('audienceRating'))
-        self.childCount = utils.cast(int, data.attrib.get('childCount'))
-        self.collectionFilterBasedOnUser = utils.cast(int, data.attrib.get('collectionFilterBasedOnUser', '0'))
-        self.collectionMode = utils.cast(int, data.attrib.get('collectionMode', '-1'))
-        self.collectionPublished = utils.cast(bool, data.attrib.get('collectionPublished', '0'))
-        self.collectionSort = utils.cast(int, data.attrib.get('collectionSort', '0'))
-        self.content = data.attrib.get('content')
-        self.contentRating = data.attrib.get('contentRating')
+        self.addedAt = toDatetime(get('addedAt'))
+        self.art = get('art')
+        self.artBlurHash = get('artBlurHash')
+        self.audienceRating = cast(float, get('audienceRating'))
+        self.childCount = _int(get('childCount'))
+        self.collectionFilterBasedOnUser = _int(get('collectionFilterBasedOnUser', '0'))
+        self.collectionMode = _int(get('collectionMode', '-1'))
+        self.collectionPublished = _bool(get('collectionPublished', '0'))
+        self.collectionSort = _int(get('collectionSort', '0'))
+        self.content = get('content')
+        self.contentRating = get('contentRating')
         self.fields = self.findItems(data, media.Field)
-        self.guid = data.attrib.get('guid')
-        self.index = utils.cast(int, data.attrib.get('index'))
-        self.key = data.attrib.get('key', '').replace('/children', '')  # FIX_BUG_50
+        self.guid = get('guid')
+        self.index = _int(get('index'))
+        key = get('key', '')
+        self.key = key[:-9] if key.endswith('/children') else key  # FIX_BUG_50
         self.labels = self.findItems(data, media.Label)
-        self.lastRatedAt = utils.toDatetime(data.attrib.get('lastRatedAt'))
-        self.librarySectionID = utils.cast(int, data.attrib.get('librarySectionID'))
-        self.librarySectionKey = data.attrib.get('librarySectionKey')
-        self.librarySectionTitle = data.attrib.get('librarySectionTitle')
-        self.maxYear = utils.cast(int, data.attrib.get('maxYear'))
-        self.minYear = utils.cast(int, data.attrib.get('minYear'))
-        self.rating = utils.cast(float, data.attrib.get('rating'))
-        self.ratingCount = utils.cast(int, data.attrib.get('ratingCount'))
-        self.ratingKey = utils.cast(int, data.attrib.get('ratingKey'))
-        self.smart = utils.cast(bool, data.attrib.get('smart', '0'))
-        self.subtype = data.attrib.get('subtype')
-        self.summary = data.attrib.get('summary')
-        self.theme = data.attrib.get('theme')
-        self.thumb = data.attrib.get('thumb')
-        self.thumbBlurHash = data.attrib.get('thumbBlurHash')
-        self.title = data.attrib.get('title')
-        self.titleSort = data.attrib.get('titleSort', self.title)
-        self.type = data.attrib.get('type')
-        self.updatedAt = utils.toDatetime(data.attrib.get('updatedAt'))
-        self.userRating = utils.cast(float, data.attrib.get('userRating'))
+        self.lastRatedAt = toDatetime(get('lastRatedAt'))
+        self.librarySectionID = _int(get('librarySectionID'))
+        self.librarySectionKey = get('librarySectionKey')
+        self.librarySectionTitle = get('librarySectionTitle')
+        self.maxYear = _int(get('maxYear'))
+        self.minYear = _int(get('minYear'))
+        self.rating = cast(float, get('rating'))
+        self.ratingCount = _int(get('ratingCount'))
+        self.ratingKey = _int(get('ratingKey'))
+        self.smart = _bool(get('smart', '0'))
+        subtype = get('subtype')
+        self.subtype = subtype
+        self.summary = get('summary')
+        self.theme = get('theme')
+        self.thumb = get('thumb')
+        self.thumbBlurHash = get('thumbBlurHash')
+        self.title = get('title')
+        self.titleSort = get('titleSort', self.title)
+        self.type = get('type')
+        self.updatedAt = toDatetime(get('updatedAt'))
+        self.userRating = cast(float, get('userRating'))
+        if subtype in _VIDEO_SUBTYPES:
+            self.listType = 'video'
+        elif subtype in _AUDIO_SUBTYPES:
+            self.listType = 'audio'
+        elif subtype in _PHOTO_SUBTYPES:
+            self.listType = 'photo'
+        else:
+            self.listType = None
+        self.metadataType = subtype
         self._items = None  # cache for self.items
+        self._itemsByTitle = None  # cache for self.item
+        self._itemsMissing = set()  # cache of titles not found by self.item
+        self._itemKeys = None  # cache for self.__contains__
         self._section = None  # cache for self.section
         self._filters = None  # cache for self.filters
 
@@ -116,42 +175,27 @@ class Collection(
             yield item
 
     def __contains__(self, other):  # pragma: no cover
-        return any(i.key == other.key for i in self.items())
+        if self._itemKeys is None:
+            self._itemKeys = {item.key for item in self.items()}
+        return other.key in self._itemKeys
 
     def __getitem__(self, key):  # pragma: no cover
         return self.items()[key]
 
-    @property
-    def listType(self):
-        """ Returns the listType for the collection. """
-        if self.isVideo:
-            return 'video'
-        elif self.isAudio:
-            return 'audio'
-        elif self.isPhoto:
-            return 'photo'
-        else:
-            raise Unsupported('Unexpected collection type')
-
-    @property
-    def metadataType(self):
-        """ Returns the type of metadata in the collection. """
-        return self.subtype
-
     @property
     def isVideo(self):
         """ Returns True if this is a video collection. """
-        return self.subtype in {'movie', 'show', 'season', 'episode'}
+        return self.subtype in _VIDEO_SUBTYPES
 
     @property
     def isAudio(self):
         """ Returns True if this is an audio collection. """
-        return self.subtype in {'artist', 'album', 'track'}
+        return self.subtype in _AUDIO_SUBTYPES
 
     @property
     def isPhoto(self):
         """ Returns True if this is a photo collection. """
-        return self.subtype in {'photoalbum', 'photo'}
+        return self.subtype in _PHOTO_SUBTYPES
 
     @property
     @deprecated('use "items" instead', stacklevel=3)
@@ -176,6 +220,7 @@ class Collection(
 
     def item(self, title):
         """ Returns the item in the collection that matches the specified title.
+            If multiple items share the same title, the first item in the collection is returned.
 
             Parameters:
                 title (str): Title of the item to return.
@@ -183,10 +228,19 @@ class Collection(
             Raises:
                 :class:`plexapi.exceptions.NotFound`: When the item is not found in the collection.
         """
-        for item in self.items():
-            if item.title.lower() == title.lower():
-                return item
-        raise NotFound(f'Item with title "{title}" not found in the collection')
+        needle = title.casefold()
+        if needle in self._itemsMissing:
+            raise NotFound(f'Item with title "{title}" not found in the collection')
+        if self._itemsByTitle is None:
+            itemsByTitle = {}
+            for item in self.items():
+                itemsByTitle.setdefault(item.title.casefold(), item)
+            self._itemsByTitle = itemsByTitle
+        item = self._itemsByTitle.get(needle)
+        if item is None:
+            self._itemsMissing.add(needle)
+            raise NotFound(f'Item with title "{title}" not found in the collection')
+        return item
 
     def items(self):
         """ Returns a list of all items in the collection. """
@@ -256,15 +310,9 @@ class Collection(
                     collection.updateMode(mode="hide")
 
         """
-        mode_dict = {
-            'default': -1,
-            'hide': 0,
-            'hideItems': 1,
-            'showItems': 2
-        }
-        key = mode_dict.get(mode)
+        key = _MODE_DICT.get(mode)
         if key is None:
-            raise BadRequest(f'Unknown collection mode: {mode}. Options {list(mode_dict)}')
+            raise BadRequest(f'Unknown collection mode: {mode}. Options {list(_MODE_DICT)}')
         return self.editAdvanced(collectionMode=key)
 
     def sortUpdate(self, sort=None):
@@ -286,14 +334,9 @@ class Collection(
         if self.smart:
             raise BadRequest('Cannot change collection order for a smart collection.')
 
-        sort_dict = {
-            'release': 0,
-            'alpha': 1,
-            'custom': 2
-        }
-        key = sort_dict.get(sort)
+        key = _SORT_DICT.get(sort)
         if key is None:
-            raise BadRequest(f'Unknown sort dir: {sort}. Options: {list(sort_dict)}')
+            raise BadRequest(f'Unknown sort dir: {sort}. Options: {list(_SORT_DICT)}')
         return self.editAdvanced(collectionSort=key)
 
     def addItems(self, items):
@@ -312,18 +355,16 @@ class Collection(
         if items and not isinstance(items, (list, tuple)):
             items = [items]
 
-        ratingKeys = []
-        for item in items:
-            if item.type != self.subtype:  # pragma: no cover
-                raise BadRequest(f'Can not mix media types when building a collection: {self.subtype} and {item.type}')
-            ratingKeys.append(str(item.ratingKey))
-
-        ratingKeys = ','.join(ratingKeys)
-        uri = f'{self._server._uriRoot()}/library/metadata/{ratingKeys}'
+        server = self._server
+        ratingKeys = ','.join(_ratingKeys(items, self.subtype))
+        uri = f'{server._uriRoot()}/library/metadata/{ratingKeys}'
 
-        args = {'uri': uri}
-        key = f"{self.key}/items{utils.joinArgs(args)}"
-        self._server.query(key, method=self._server._session.put)
+        key = f"{self.key}/items?uri={quote(uri, safe='')}"
+        server.query(key, method=server._session.put)
+        self._items = None
+        self._itemsByTitle = None
+        self._itemsMissing.clear()
+        self._itemKeys = None
         return self
 
     def removeItems(self, items):
@@ -339,12 +380,19 @@ class Collection(
         if self.smart:
             raise BadRequest('Cannot remove items from a smart collection.')
 
-        if items and not isinstance(items, (list, tuple)):
+        if not items:
+            return self
+
+        if not isinstance(items, (list, tuple)):
             items = [items]
 
-        for item in items:
-            key = f'{self.key}/items/{item.ratingKey}'
-            self._server.query(key, method=self._server._session.delete)
+        ratingKeys = ','.join(str(item.ratingKey) for item in items)
+        key = f'{self.key}/items/{ratingKeys}'
+        self._server.query(key, method=self._server._session.delete)
+        self._items = None
+        self._itemsByTitle = None
+        self._itemsMissing.clear()
+        self._itemKeys = None
         return self
 
     def moveItem(self, item, after=None):
@@ -391,14 +439,18 @@ class Collection(
         if not self.smart:
             raise BadRequest('Cannot update filters for a regular collection.')
 
+        server = self._server
         section = self.section()
         searchKey = section._buildSearchKey(
             sort=sort, libtype=libtype, limit=limit, filters=filters, **kwargs)
-        uri = f'{self._server._uriRoot()}{searchKey}'
+        uri = f'{server._uriRoot()}{searchKey}'
 
-        args = {'uri': uri}
-        key = f"{self.key}/items{utils.joinArgs(args)}"
-        self._server.query(key, method=self._server._session.put)
+        key = f"{self.key}/items?uri={quote(uri, safe='')}"
+        server.query(key, method=server._session.put)
+        self._items = None
+        self._itemsByTitle = None
+        self._itemsMissing.clear()
+        self._itemKeys = None
         return self
 
     @deprecated('use editTitle, editSortTitle, editContentRating, and editSummary instead')
@@ -412,18 +464,16 @@ class Collection(
                 summary (str, optional): The summary of the collection.
         """
         args = {}
-        if title is not None:
-            args['title.value'] = title
-            args['title.locked'] = 1
-        if titleSort is not None:
-            args['titleSort.value'] = titleSort
-            args['titleSort.locked'] = 1
-        if contentRating is not None:
-            args['contentRating.value'] = contentRating
-            args['contentRating.locked'] = 1
-        if summary is not None:
-            args['summary.value'] = summary
-            args['summary.locked'] = 1
+        fields = (
+            ('title', title),
+            ('titleSort', titleSort),
+            ('contentRating', contentRating),
+            ('summary', summary),
+        )
+        for field, value in fields:
+            if value is not None:
+                args[f'{field}.value'] = value
+                args[f'{field}.locked'] = 1
 
         args.update(kwargs)
         self._edit(**args)
@@ -445,16 +495,13 @@ class Collection(
             items = [items]
 
         itemType = items[0].type
-        ratingKeys = []
-        for item in items:
-            if item.type != itemType:  # pragma: no cover
-                raise BadRequest('Can not mix media types when building a collection.')
-            ratingKeys.append(str(item.ratingKey))
-
-        ratingKeys = ','.join(ratingKeys)
-        uri = f'{server._uriRoot()}/library/metadata/{ratingKeys}'
+        root = server._uriRoot()
+        searchType = utils.searchType(itemType)
+        sectionId = section.key
+        ratingKeys = ','.join(_ratingKeys(items, itemType))
+        uri = f'{root}/library/metadata/{ratingKeys}'
 
-        args = {'uri': uri, 'type': utils.searchType(itemType), 'title': title, 'smart': 0, 'sectionId': section.key}
+        args = {'uri': uri, 'type': searchType, 'title': title, 'smart': 0, 'sectionId': sectionId}
         key = f"/library/collections{utils.joinArgs(args)}"
         data = server.query(key, method=server._session.post)[0]
         return cls(server, data, initpath=key)
@@ -467,11 +514,14 @@ class Collection(
 
         libtype = libtype or section.TYPE
 
+        root = server._uriRoot()
+        searchType = utils.searchType(libtype)
+        sectionId = section.key
         searchKey = section._buildSearchKey(
             sort=sort, libtype=libtype, limit=limit, filters=filters, **kwargs)
-        uri = f'{server._uriRoot()}{searchKey}'
+        uri = f'{root}{searchKey}'
 
-        args = {'uri': uri, 'type': utils.searchType(libtype), 'title': title, 'smart': 1, 'sectionId': section.key}
+        args = {'uri': uri, 'type': searchType, 'title': title, 'smart': 1, 'sectionId': sectionId}
         key = f"/library/collections{utils.joinArgs(args)}"
         data = server.query(key, method=server._session.post)[0]
         return cls(server, data, initpath=key)